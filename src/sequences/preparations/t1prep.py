@@ -1,10 +1,114 @@
 """Adiabatic T1 preparation block."""
 
+from types import SimpleNamespace
+
 import pypulseq as pp
 
 from sequences.utils import sys_defaults
 
 
+def build_t1prep_events(
+    system: pp.Opts | None = None,
+    rf_duration: float = 10.24e-3,
+    add_spoiler: bool = True,
+    spoiler_ramp_time: float = 6e-4,
+    spoiler_flat_time: float = 8.4e-3,
+) -> tuple[SimpleNamespace, SimpleNamespace | None]:
+    """Build the RF and gradient events of an adiabatic T1 preparation block.
+
+    The returned events are independent of the inversion time, so they can be built once
+    and reused via :func:`apply_t1prep` when the preparation is played out repeatedly.
+
+    Parameters
+    ----------
+    system
+        PyPulseq system limit object.
+    rf_duration
+        Duration of the adiabatic inversion pulse (in seconds).
+    add_spoiler
+        Toggles creation of a spoiler gradient to be played out after the inversion pulse.
+    spoiler_ramp_time
+        Duration of gradient spoiler ramps (in seconds).
+    spoiler_flat_time
+        Duration of gradient spoiler plateau (in seconds).
+
+    Returns
+    -------
+    rf
+        Adiabatic inversion pulse event.
+    gz_spoil
+        Spoiler gradient event or None if add_spoiler is False.
+    """
+    # set system to default if not provided
+    if system is None:
+        system = sys_defaults
+
+    rf = pp.make_adiabatic_pulse(
+        pulse_type='hypsec',
+        adiabaticity=6,
+        beta=800,
+        mu=4.9,
+        delay=system.rf_dead_time,
+        duration=rf_duration,
+        system=system,
+        use='inversion',
+    )
+
+    gz_spoil = None
+    if add_spoiler:
+        gz_spoil = pp.make_trapezoid(
+            channel='z',
+            amplitude=0.4 * system.max_grad,
+            flat_time=spoiler_flat_time,
+            rise_time=spoiler_ramp_time,
+            system=system,
+        )
+
+    return (rf, gz_spoil)
+
+
+def apply_t1prep(
+    seq: pp.Sequence,
+    rf: SimpleNamespace,
+    gz_spoil: SimpleNamespace | None,
+    tau: float,
+) -> tuple[pp.Sequence, float]:
+    """Add pre-built T1 preparation events to a sequence.
+
+    Parameters
+    ----------
+    seq
+        PyPulseq Sequence object.
+    rf
+        Adiabatic inversion pulse event as returned by :func:`build_t1prep_events`.
+    gz_spoil
+        Spoiler gradient event or None to skip the spoiler.
+    tau
+        Delay after the inversion pulse (and spoiler, if any) to realize the inversion time (in seconds).
+
+    Returns
+    -------
+    seq
+        PyPulseq Sequence object.
+    block_duration
+        Total duration of the T1 preparation block (in seconds).
+    """
+    block_duration = 0.0
+
+    seq.add_block(rf)
+    block_duration += pp.calc_duration(rf)
+
+    if gz_spoil is not None:
+        seq.add_block(gz_spoil)
+        block_duration += pp.calc_duration(gz_spoil)
+
+    if tau > 0:
+        seq.add_block(pp.make_delay(tau))
+        block_duration += tau
+
+    return (seq, block_duration)
+
+
 def add_t1prep(
     seq: pp.Sequence | None = None,
     system: pp.Opts | None = None,
@@ -13,6 +117,7 @@ def add_t1prep(
     add_spoiler: bool = True,
     spoiler_ramp_time: float = 6e-4,
     spoiler_flat_time: float = 8.4e-3,
+    gz_spoil: SimpleNamespace | None = None,
 ) -> tuple[pp.Sequence, float]:
     """Add an adiabatic T1 preparation block to a sequence.
 
@@ -35,6 +140,9 @@ def add_t1prep(
         Duration of gradient spoiler ramps (in seconds).
     spoiler_flat_time
         Duration of gradient spoiler plateau (in seconds).
+    gz_spoil
+        Pre-built spoiler gradient event to reuse, e.g. when the preparation is added repeatedly.
+        Overrides spoiler_ramp_time and spoiler_flat_time. Ignored if add_spoiler is False.
 
     Returns
     -------
@@ -55,45 +163,29 @@ def add_t1prep(
     if seq is None:
         seq = pp.Sequence(system=system)
 
-    # get current duration of sequence before adding T2prep block
-    time_start = sum(seq.block_durations.values())
-
     # calculate inversion time delay
-    total_spoil_time = (2 * spoiler_ramp_time + spoiler_flat_time) if add_spoiler else 0
+    if not add_spoiler:
+        gz_spoil = None
+        total_spoil_time = 0
+    elif gz_spoil is not None:
+        total_spoil_time = pp.calc_duration(gz_spoil)
+    else:
+        total_spoil_time = 2 * spoiler_ramp_time + spoiler_flat_time
     tau = inversion_time - rf_duration / 2 - system.rf_ringdown_time - total_spoil_time
 
     # check if delay is valid
     if tau < 0:
         raise ValueError('Inversion time too short for given RF and spoiler durations.')
 
-    # Add adiabatic inversion pulse
-    rf = pp.make_adiabatic_pulse(
-        pulse_type='hypsec',
-        adiabaticity=6,
-        beta=800,
-        mu=4.9,
-        delay=system.rf_dead_time,
-        duration=rf_duration,
+    # build events and add them to the sequence; the spoiler is only built if not provided by the caller
+    rf, gz_spoil_built = build_t1prep_events(
         system=system,
-        use='inversion',
+        rf_duration=rf_duration,
+        add_spoiler=add_spoiler and gz_spoil is None,
+        spoiler_ramp_time=spoiler_ramp_time,
+        spoiler_flat_time=spoiler_flat_time,
     )
-    seq.add_block(rf)
-
-    # Add spoiler gradient if requested
-    if add_spoiler:
-        gz_spoil = pp.make_trapezoid(
-            channel='z',
-            amplitude=0.4 * system.max_grad,
-            flat_time=spoiler_flat_time,
-            rise_time=spoiler_ramp_time,
-            system=system,
-        )
-        seq.add_block(gz_spoil)
-
-    if tau > 0:
-        seq.add_block(pp.make_delay(tau))
-
-    # calculate total duration of T1prep block
-    block_duration = sum(seq.block_durations.values()) - time_start
+    if gz_spoil_built is not None:
+        gz_spoil = gz_spoil_built
 
-    return (seq, block_duration)
+    return apply_t1prep(seq=seq, rf=rf, gz_spoil=gz_spoil, tau=tau)
@@ -1,6 +1,8 @@
 """MLEV-4 type T2 preparation block."""
 
-from copy import deepcopy
+import math
+from copy import copy
+from types import SimpleNamespace
 
 import numpy as np
 import pypulseq as pp
@@ -8,11 +10,42 @@ import pypulseq as pp
 from sequences.utils import sys_defaults
 
 
+def _make_rf_templates(system: pp.Opts, duration_180: float) -> tuple[SimpleNamespace, SimpleNamespace]:
+    """Create the 90° and 180° block pulse templates used by the composite refocusing blocks."""
+    rf_90 = pp.make_block_pulse(
+        flip_angle=np.pi / 2,
+        delay=system.rf_dead_time,
+        duration=duration_180 / 2,
+        system=system,
+        use='preparation',
+    )
+    rf_180 = pp.make_block_pulse(
+        flip_angle=np.pi,
+        delay=system.rf_dead_time,
+        duration=duration_180,
+        system=system,
+        use='preparation',
+    )
+    return (rf_90, rf_180)
+
+
+def _rf_with_phase(template: SimpleNamespace, phase_offset: float) -> SimpleNamespace:
+    """Shallow-copy an RF template and override its phase offset.
+
+    The phase offset is stored as a separate attribute and applied by PyPulseq at write time,
+    so the signal array can be shared between all copies of a template.
+    """
+    rf = copy(template)
+    rf.phase_offset = phase_offset
+    return rf
+
+
 def add_composite_refocusing_block(
     seq: pp.Sequence,
     system: pp.Opts,
     duration_180: float,
     negative_amp: bool = False,
+    rf_templates: tuple[SimpleNamespace, SimpleNamespace] | None = None,
 ) -> tuple[pp.Sequence, float, float]:
     """Add a 90°x, +/-180°y, 90°x refocusing block to a sequence.
 
@@ -26,6 +59,9 @@ def add_composite_refocusing_block(
         Duration of 180° refocussing block pulse (in seconds). The 90° pulses have half this duration.
     negative_amp
         Toggles negative amplitude for 180°y pulse. By default, positive amplitudes are used.
+    rf_templates
+        Pre-built (90°, 180°) block pulse templates matching system and duration_180.
+        If None, the templates are created on the fly.
 
     Returns
     -------
@@ -46,37 +82,35 @@ def add_composite_refocusing_block(
     if system.rf_dead_time is None:
         raise ValueError('rf_dead_time must be provided in system limits.')
 
-    # set rf_ringdown_time to 0 within this preparation block, since no ADC events are used
-    system = deepcopy(system)
-    system.rf_ringdown_time = 0
-
-    # define flip angles and durations of RF pulses
-    flip_angles = [90, 180, 90]
+    # define durations of RF pulses
     durations = [duration_180 / 2, duration_180, duration_180 / 2]
 
-    # set phases of RF pulses according to negative_amp flag
+    # set phases of RF pulses (in radians) according to negative_amp flag
     if not negative_amp:
-        phases = [0, 90, 0]
+        phases = [0.0, math.pi / 2, 0.0]
     else:
-        phases = [180, 270, 180]
+        phases = [math.pi, 3 * math.pi / 2, math.pi]
 
-    # get current duration of sequence before adding composite refocusing block
-    time_start = sum(seq.block_durations.values())
+    # track total block duration instead of re-summing seq.block_durations after every addition
+    block_duration = 0.0
 
-    # add RF pulses to sequence
-    for fa, phase, dur in zip(flip_angles, phases, durations, strict=True):
-        rf = pp.make_block_pulse(
-            flip_angle=fa * np.pi / 180,
-            delay=system.rf_dead_time,
-            duration=dur,
-            phase_offset=phase * np.pi / 180,
-            system=system,
-            use='preparation',
-        )
-        seq.add_block(rf)
-
-    # calculate total block duration
-    block_duration = sum(seq.block_durations.values()) - time_start
+    # set rf_ringdown_time to 0 within this preparation block, since no ADC events are used.
+    # save/restore the attribute instead of deep-copying the whole Opts object.
+    _saved_ringdown_time = system.rf_ringdown_time
+    system.rf_ringdown_time = 0
+    try:
+        # create the two unique block pulse templates unless provided by the caller
+        if rf_templates is None:
+            rf_templates = _make_rf_templates(system=system, duration_180=duration_180)
+        rf_90, rf_180 = rf_templates
+
+        # add RF pulses to sequence, reusing the templates and only overriding the phase offset
+        for template, phase in zip([rf_90, rf_180, rf_90], phases, strict=True):
+            rf = _rf_with_phase(template, phase)
+            seq.add_block(rf)
+            block_duration += pp.calc_duration(rf)
+    finally:
+        system.rf_ringdown_time = _saved_ringdown_time
 
     # calculate time from start to midpoint of block
     time_to_midpoint = system.rf_dead_time + durations[0] + system.rf_dead_time + durations[1] / 2
@@ -153,139 +187,152 @@ def add_t2prep(
     if system.rf_dead_time is None:
         raise ValueError('rf_dead_time must be provided in system limits.')
 
-    # set rf_ringdown_time to 0 within this preparation block, since no ADC events are used
-    system = deepcopy(system)
-    system.rf_ringdown_time = 0
-
-    if seq is None:
-        seq = pp.Sequence(system=system)
-
-    # get current duration of sequence before adding T2prep block
-    time_start = sum(seq.block_durations.values())
-
-    # Create 90°x excitation pulse
-    rf_90 = pp.make_block_pulse(
-        flip_angle=np.pi / 2,
-        delay=system.rf_dead_time,
-        duration=duration_180 / 2,
-        system=system,
-        use='preparation',
-    )
-
-    # add 90°x pulse to sequence
-    seq.add_block(rf_90)
+    # set rf_ringdown_time to 0 within this preparation block, since no ADC events are used.
+    # save/restore the attribute instead of deep-copying the whole Opts object.
+    _saved_ringdown_time = system.rf_ringdown_time
+    try:
+        system.rf_ringdown_time = 0
+
+        if seq is None:
+            # give the internal sequence its own Opts object, so the zeroed ringdown time stays in
+            # effect on the returned sequence after the caller's system limits are restored below
+            seq = pp.Sequence(system=copy(system))
+
+        # get current duration of sequence before adding T2prep block.
+        # the totals are taken from the block table once at entry and exit so the returned duration
+        # matches sum(seq.block_durations.values()) exactly.
+        time_start = sum(seq.block_durations.values())
+
+        # create the block pulse templates once; they are reused by all four composite refocusing blocks
+        rf_templates = _make_rf_templates(system=system, duration_180=duration_180)
+
+        # the 90°x excitation pulse is identical to the 90° template
+        rf_90 = rf_templates[0]
+
+        # add 90°x pulse to sequence
+        seq.add_block(rf_90)
+
+        # Calculate delay before 1st MLEV-4 refocusing pulse
+        tau1 = (
+            echo_time / 8
+            - duration_180 / 4  # half duration of 90° excitation pulse
+            - (system.rf_dead_time + duration_180 / 2)  # duration of 90° pulse in composite refocusing block
+            - (system.rf_dead_time + duration_180 / 2)  # half duration of 180° pulse in composite refocusing block
+        )
 
-    # Calculate delay before 1st MLEV-4 refocusing pulse
-    tau1 = (
-        echo_time / 8
-        - duration_180 / 4  # half duration of 90° excitation pulse
-        - (system.rf_dead_time + duration_180 / 2)  # duration of 90° pulse in composite refocusing block
-        - (system.rf_dead_time + duration_180 / 2)  # half duration of 180° pulse in composite refocusing block
-    )
+        if tau1 < 0:
+            raise ValueError(f'Desired echo time ({echo_time * 1000:.2f} ms) is too short to create the T2 prep block.')
 
-    if tau1 < 0:
-        raise ValueError(f'Desired echo time ({echo_time * 1000:.2f} ms) is too short to create the T2 prep block.')
+        # add delay tau1 to sequence
+        seq.add_block(pp.make_delay(tau1))
 
-    # add delay tau1 to sequence
-    seq.add_block(pp.make_delay(tau1))
+        # add first MLEV-4 refocusing pulse
+        seq, refoc_dur, time_to_midpoint = add_composite_refocusing_block(
+            system=system,
+            duration_180=duration_180,
+            seq=seq,
+            negative_amp=False,
+            rf_templates=rf_templates,
+        )
 
-    # add first MLEV-4 refocusing pulse
-    seq, refoc_dur, time_to_midpoint = add_composite_refocusing_block(
-        system=system,
-        duration_180=duration_180,
-        seq=seq,
-        negative_amp=False,
-    )
+        # add delay before 2nd MLEV-4 refocusing pulse
+        tau2 = (
+            echo_time / 4
+            - (refoc_dur - time_to_midpoint)  # time from midpoint of 180° pulse in 1st refoc block to end of block
+            - time_to_midpoint  # time from start of 2nd refocusing block to midpoint of 180° pulse
+        )
 
-    # add delay before 2nd MLEV-4 refocusing pulse
-    tau2 = (
-        echo_time / 4
-        - (refoc_dur - time_to_midpoint)  # time from midpoint of 180° pulse in 1st refocussing block to end of block
-        - time_to_midpoint  # time from start of 2nd refocusing block to midpoint of 180° pulse
-    )
+        if tau2 < 0:
+            raise ValueError(f'Desired echo time ({echo_time * 1000:.2f} ms) is too short to create the T2 prep block.')
 
-    if tau2 < 0:
-        raise ValueError(f'Desired echo time ({echo_time * 1000:.2f} ms) is too short to create the T2 prep block.')
+        # create delay tau2 once; the same event is reused before the 2nd, 3rd and 4th refocusing pulse
+        delay_tau2 = pp.make_delay(tau2)
 
-    # add delay tau2 to sequence
-    seq.add_block(pp.make_delay(tau2))
+        # add delay tau2 to sequence
+        seq.add_block(delay_tau2)
 
-    # add second MLEV-4 refocusing pulse
-    seq, _, _ = add_composite_refocusing_block(
-        system=system,
-        duration_180=duration_180,
-        seq=seq,
-        negative_amp=False,
-    )
-
-    # add delay before 3rd MLEV-4 refocusing pulse. The delay time is given by tau2 as well.
-    seq.add_block(pp.make_delay(tau2))
+        # add second MLEV-4 refocusing pulse
+        seq, _, _ = add_composite_refocusing_block(
+            system=system,
+            duration_180=duration_180,
+            seq=seq,
+            negative_amp=False,
+            rf_templates=rf_templates,
+        )
 
-    # add third MLEV-4 refocusing pulse
-    seq, _, _ = add_composite_refocusing_block(
-        system=system,
-        duration_180=duration_180,
-        seq=seq,
-        negative_amp=True,
-    )
+        # add delay before 3rd MLEV-4 refocusing pulse. The delay time is given by tau2 as well.
+        seq.add_block(delay_tau2)
 
-    # add delay before 4th MLEV-4 refocusing pulse. The delay time is given by tau2 as well.
-    seq.add_block(pp.make_delay(tau2))
+        # add third MLEV-4 refocusing pulse
+        seq, _, _ = add_composite_refocusing_block(
+            system=system,
+            duration_180=duration_180,
+            seq=seq,
+            negative_amp=True,
+            rf_templates=rf_templates,
+        )
 
-    # add fourth MLEV-4 refocusing pulse
-    seq, _, _ = add_composite_refocusing_block(
-        system=system,
-        duration_180=duration_180,
-        seq=seq,
-        negative_amp=True,
-    )
+        # add delay before 4th MLEV-4 refocusing pulse. The delay time is given by tau2 as well.
+        seq.add_block(delay_tau2)
 
-    # add delay before first tip-up pulse
-    tau3 = (
-        echo_time / 8
-        - (refoc_dur - time_to_midpoint)  # time from midpoint to end of 4th refocusing block
-        - (system.rf_dead_time + duration_180 / 2 * 3 / 2)  # half duration of 270° pulse)
-    )
+        # add fourth MLEV-4 refocusing pulse
+        seq, _, _ = add_composite_refocusing_block(
+            system=system,
+            duration_180=duration_180,
+            seq=seq,
+            negative_amp=True,
+            rf_templates=rf_templates,
+        )
 
-    if tau3 < 0:
-        raise ValueError(f'Desired echo time ({echo_time * 1000:.2f} ms) is too short to create the T2 prep block.')
+        # add delay before first tip-up pulse
+        tau3 = (
+            echo_time / 8
+            - (refoc_dur - time_to_midpoint)  # time from midpoint to end of 4th refocusing block
+            - (system.rf_dead_time + duration_180 / 2 * 3 / 2)  # half duration of 270° pulse)
+        )
 
-    # add delay tau3 to sequence
-    seq.add_block(pp.make_delay(tau3))
+        if tau3 < 0:
+            raise ValueError(f'Desired echo time ({echo_time * 1000:.2f} ms) is too short to create the T2 prep block.')
 
-    # create 270° pulse of composite tip-up pulse (270°x + [-360]°x)
-    rf_tip_up_270 = pp.make_block_pulse(
-        flip_angle=3 * np.pi / 2,
-        delay=system.rf_dead_time,
-        duration=duration_180 / 2 * 3,
-        system=system,
-        use='preparation',
-    )
+        # add delay tau3 to sequence
+        seq.add_block(pp.make_delay(tau3))
 
-    # create -360° pulse of composite tip-up pulse (270°x + [-360]°x)
-    rf_tip_up_360 = pp.make_block_pulse(
-        flip_angle=-2 * np.pi,
-        delay=system.rf_dead_time,
-        duration=duration_180 * 2,
-        system=system,
-        use='preparation',
-    )
+        # create 270° pulse of composite tip-up pulse (270°x + [-360]°x)
+        rf_tip_up_270 = pp.make_block_pulse(
+            flip_angle=3 * np.pi / 2,
+            delay=system.rf_dead_time,
+            duration=duration_180 / 2 * 3,
+            system=system,
+            use='preparation',
+        )
 
-    # add composite tip-up pulse to sequence
-    seq.add_block(rf_tip_up_270)
-    seq.add_block(rf_tip_up_360)
-
-    # add spoiler gradient if requested
-    if add_spoiler:
-        gz_spoil = pp.make_trapezoid(
-            channel='z',
-            amplitude=0.4 * system.max_grad,
-            flat_time=spoiler_flat_time,
-            rise_time=spoiler_ramp_time,
+        # create -360° pulse of composite tip-up pulse (270°x + [-360]°x)
+        rf_tip_up_360 = pp.make_block_pulse(
+            flip_angle=-2 * np.pi,
+            delay=system.rf_dead_time,
+            duration=duration_180 * 2,
             system=system,
+            use='preparation',
         )
-        seq.add_block(gz_spoil)
 
-    block_duration = sum(seq.block_durations.values()) - time_start
+        # add composite tip-up pulse to sequence
+        seq.add_block(rf_tip_up_270)
+        seq.add_block(rf_tip_up_360)
+
+        # add spoiler gradient if requested
+        if add_spoiler:
+            gz_spoil = pp.make_trapezoid(
+                channel='z',
+                amplitude=0.4 * system.max_grad,
+                flat_time=spoiler_flat_time,
+                rise_time=spoiler_ramp_time,
+                system=system,
+            )
+            seq.add_block(gz_spoil)
+
+        block_duration = sum(seq.block_durations.values()) - time_start
+
+    finally:
+        system.rf_ringdown_time = _saved_ringdown_time
 
     return (seq, block_duration)
@@ -1,3 +1,4 @@
+from sequences.utils.system_defaults import default_system
 from sequences.utils.system_defaults import sys_defaults
 
-__all__ = ["sys_defaults"]
+__all__ = ["default_system", "sys_defaults"]
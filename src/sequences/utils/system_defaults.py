@@ -2,12 +2,18 @@
 
 from pypulseq.opts import Opts
 
-sys_defaults = Opts(
-    max_grad=30,
-    grad_unit='mT/m',
-    max_slew=120,
-    slew_unit='T/m/s',
-    rf_ringdown_time=30e-6,
-    rf_dead_time=100e-6,
-    adc_dead_time=10e-6,
-)
+
+def default_system() -> Opts:
+    """Create a fresh Opts object with the default system limits of the sequences package."""
+    return Opts(
+        max_grad=30,
+        grad_unit='mT/m',
+        max_slew=120,
+        slew_unit='T/m/s',
+        rf_ringdown_time=30e-6,
+        rf_dead_time=100e-6,
+        adc_dead_time=10e-6,
+    )
+
+
+sys_defaults = default_system()
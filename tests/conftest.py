@@ -1,12 +1,10 @@
 """PyTest fixtures for the PTB-MR/sequences package."""
 
-from copy import deepcopy
-
 import pytest
-from sequences.utils import sys_defaults
+from sequences.utils import default_system
 
 
 @pytest.fixture(scope='function')
 def system_defaults():
     """System defaults for sequence generation."""
-    return deepcopy(sys_defaults)
+    return default_system()
@@ -110,3 +110,19 @@ def test_add_t2prep_duration(
 
     assert sum(seq.block_durations.values()) == block_duration
     assert block_duration == pytest.approx(manual_time_calc)
+
+
+def test_add_t2prep_system_not_modified(system_defaults):
+    """Test if the rf_ringdown_time of the provided system limits is restored after the call."""
+    rf_ringdown_time = system_defaults.rf_ringdown_time
+
+    add_t2prep(system=system_defaults)
+
+    assert system_defaults.rf_ringdown_time == rf_ringdown_time
+
+
+def test_add_t2prep_check_timing():
+    """Test if an internally created sequence passes the PyPulseq timing checks."""
+    seq, _ = add_t2prep()
+
+    assert seq.check_timing()[0]
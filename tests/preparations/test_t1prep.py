@@ -3,6 +3,8 @@
 import pypulseq as pp
 import pytest
 from sequences.preparations.t1prep import add_t1prep
+from sequences.preparations.t1prep import apply_t1prep
+from sequences.preparations.t1prep import build_t1prep_events
 
 
 def test_add_t1prep_system_defaults_if_none(system_defaults):
@@ -56,3 +58,35 @@ def test_add_t1prep_duration(
 
     assert sum(seq.block_durations.values()) == block_duration
     assert block_duration == pytest.approx(manual_time_calc)
+
+
+def test_build_t1prep_events_no_spoiler(system_defaults):
+    """Test if no spoiler gradient is returned when add_spoiler is False."""
+    _, gz_spoil = build_t1prep_events(system=system_defaults, add_spoiler=False)
+
+    assert gz_spoil is None
+
+
+def test_apply_t1prep_reuse_events(system_defaults):
+    """Test if pre-built events can be reused and match the duration of add_t1prep."""
+    rf, gz_spoil = build_t1prep_events(system=system_defaults)
+    tau = 21e-3 - 10.24e-3 / 2 - system_defaults.rf_ringdown_time - (2 * 6e-4 + 8.4e-3)
+
+    seq = pp.Sequence(system=system_defaults)
+    seq, block_duration1 = apply_t1prep(seq=seq, rf=rf, gz_spoil=gz_spoil, tau=tau)
+    seq, block_duration2 = apply_t1prep(seq=seq, rf=rf, gz_spoil=gz_spoil, tau=tau)
+    _, block_duration3 = add_t1prep(system=system_defaults)
+
+    assert block_duration1 == block_duration2
+    assert block_duration1 == block_duration3
+    assert sum(seq.block_durations.values()) == pytest.approx(2 * block_duration1)
+
+
+def test_add_t1prep_prebuilt_spoiler(system_defaults):
+    """Test if a pre-built spoiler gradient yields the same block duration as the built-in one."""
+    _, gz_spoil = build_t1prep_events(system=system_defaults)
+
+    _, block_duration1 = add_t1prep(system=system_defaults, gz_spoil=gz_spoil)
+    _, block_duration2 = add_t1prep(system=system_defaults)
+
+    assert block_duration1 == block_duration2